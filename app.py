@@ -1,19 +1,60 @@
 from flask import Flask, request, jsonify
-from urllib.parse import quote
+from flask.json.provider import JSONProvider
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
+from bisect import bisect_right
 import logging
+import re
 import swisseph as swe
 import math
+import orjson
+
+class ORJSONProvider(JSONProvider):
+    """Serialize jsonify responses with orjson instead of the stdlib json module"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+        
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+        
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS),
+                                        mimetype='application/json')
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Set absolute ephemeris path for Render
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 EPHE_PATH = os.path.join(BASE_DIR, 'ephe')
+# Swiss Ephemeris keeps its path per thread, so set_ephe_path() below only covers
+# the importing thread; request threads fall back to SE_EPHE_PATH from the environment
+os.environ.setdefault('SE_EPHE_PATH', EPHE_PATH)
 
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+# (connect, read) seconds. SESSION retries a failed connect once and never a
+# read timeout, so an unreachable host gives up after ~6s and a geocode holds
+# a request thread for at most about one connect plus one read timeout (~13s)
+GEOCODE_TIMEOUT = (3, 10)
+
+# Shared HTTP session so geocoding calls reuse pooled keep-alive connections;
+# transient rate-limit/server errors are retried, then handed back as-is.
+# Retry-After is ignored and read timeouts are never retried, so a hung
+# Google reply costs one read timeout rather than one per attempt
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                                      max_retries=Retry(total=2, connect=1, read=0, backoff_factor=0.2,
+                                                        status_forcelist=(429, 500, 502, 503, 504),
+                                                        respect_retry_after_header=False,
+                                                        raise_on_status=False)))
 
 # Setup logging FIRST - this is the fix for the NameError
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -31,7 +72,9 @@ try:
     # Test ephemeris
     test_jd = swe.julday(2000, 1, 1, 12.0)
     test_result = swe.calc_ut(test_jd, swe.SUN)
-    if test_result[1] == 0:
+    if test_result[1] >= 0 and test_result[1] & swe.FLG_MOSEPH:
+        logger.warning(f"Ephemeris files not found, using Moshier: Sun at {test_result[0][0]:.2f}°")
+    elif test_result[1] >= 0:
         logger.info(f"Ephemeris test successful: Sun at {test_result[0][0]:.2f}°")
     else:
         logger.warning(f"Ephemeris test failed with error: {test_result[1]}")
@@ -40,6 +83,10 @@ except Exception as e:
     logger.error(f"Ephemeris setup failed: {e}")
     swe.set_ephe_path("")
 
+# Zodiac signs in ordinal order (0 = Aries)
+SIGNS = ('Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces')
+
 # Zodiac Elements and Modes (Tropical Zodiac)
 ELEMENTS = {
     'ARIES': 'Fire', 'TAURUS': 'Earth', 'GEMINI': 'Air', 'CANCER': 'Water',
@@ -53,6 +100,66 @@ MODES = {
     'SAGITTARIUS': 'Mutable', 'CAPRICORN': 'Cardinal', 'AQUARIUS': 'Fixed', 'PISCES': 'Mutable'
 }
 
+ELEMENT_NAMES = ('Fire', 'Earth', 'Air', 'Water')
+MODE_NAMES = ('Cardinal', 'Fixed', 'Mutable')
+
+# (element index, mode index) per zodiac ordinal (0 = Aries) so the chart
+# tally is pure integer indexing with no string hashing
+SIGN_INFO = tuple((ELEMENT_NAMES.index(ELEMENTS[sign]), MODE_NAMES.index(MODES[sign]))
+                  for sign in ELEMENTS)
+
+# Birth date/time formats: YYYY-MM-DD (or YYYY/MM/DD) and 24-hour
+# "21:05", "21:05:30" or 12-hour "09:05 PM" (minutes may be one digit, as with strptime)
+DATE_PATTERN = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+TIME_PATTERN = re.compile(r'^(\d{1,2}):(\d{1,2})(?::(\d{1,2})|\s+([AaPp][Mm]))?$')
+
+# Moon phase and TCM energy per 45° of Sun-Moon angular distance
+MOON_PHASES = (
+    ("New Moon", "Rest & Renewal"),
+    ("Waxing Crescent", "Growth & Building"),
+    ("First Quarter", "Growth & Building"),
+    ("Waxing Gibbous", "Expansion & Harvest"),
+    ("Full Moon", "Expansion & Harvest"),
+    ("Waning Gibbous", "Release & Cleansing"),
+    ("Last Quarter", "Release & Cleansing"),
+    ("Waning Crescent", "Deep Rest")
+)
+
+# Standard planets as (name, Swiss Ephemeris id)
+PLANETS = (
+    ('Sun', swe.SUN),
+    ('Moon', swe.MOON),
+    ('Mercury', swe.MERCURY),
+    ('Venus', swe.VENUS),
+    ('Mars', swe.MARS),
+    ('Jupiter', swe.JUPITER),
+    ('Saturn', swe.SATURN),
+    ('Uranus', swe.URANUS),
+    ('Neptune', swe.NEPTUNE),
+    ('Pluto', swe.PLUTO)
+)
+
+# Bodies activating Human Design gates
+HD_PLANETS = PLANETS + (('North Node', swe.MEAN_NODE),)
+
+# Bodies placed on the astrology chart, including Lilith (Mean Black Moon)
+CHART_PLANETS = PLANETS + (('Chiron', swe.CHIRON), ('Lilith', swe.MEAN_APOG))
+
+# Human Design gates in zodiac order around the wheel, starting at GATE_WHEEL_START
+# (Gate 25 straddles 0° Aries, so it comes last)
+GATE_ORDER = (
+    17, 21, 51, 42, 3, 27, 24, 2, 23, 8, 20, 16, 35, 45, 12, 15,
+    52, 39, 53, 62, 56, 31, 33, 7, 4, 29, 59, 40, 64, 47, 6, 46,
+    18, 48, 57, 32, 50, 28, 44, 1, 43, 14, 34, 9, 5, 26, 11, 10,
+    58, 38, 54, 61, 60, 41, 19, 13, 49, 30, 55, 37, 63, 22, 36, 25
+)
+GATE_WHEEL_START = 3.875     # 3°52'30" Aries
+GATE_WIDTH = 360.0 / 64      # 5°37'30"
+LINE_WIDTH = GATE_WIDTH / 6  # 0°56'15"
+
+# The Design chart is cast 88.25 days (88 days 6 hours) before birth
+DESIGN_OFFSET_DAYS = 88.25
+
 # Human Design Centers and their associated gates
 CENTER_GATES = {
     'Head': [61, 63, 64],
@@ -81,31 +188,68 @@ CHANNELS = {
     (53, 42): 'Maturation'
 }
 
+# Gate bitmasks (bit n = gate n) per center and per channel, with the channel's response label
+CENTER_MASKS = {center: sum(1 << gate for gate in gates) for center, gates in CENTER_GATES.items()}
+CHANNEL_MASKS = tuple(((1 << gate1) | (1 << gate2), f"{gate1}-{gate2} ({channel_name})")
+                      for (gate1, gate2), channel_name in CHANNELS.items())
+
 def decimal_to_dms(decimal):
     """Convert decimal degrees to degrees:minutes:seconds format"""
-    is_negative = decimal < 0
-    decimal = abs(decimal)
-    degrees = int(decimal)
-    minutes_float = (decimal - degrees) * 60
-    minutes = int(minutes_float)
-    seconds = int((minutes_float - minutes) * 60)
-    return f"{'-' if is_negative else ''}{degrees}:{minutes}:{seconds}"
+    # Work in whole arc-seconds so there is one float->int conversion and no truncation cascade
+    total_seconds = round(decimal * 3600)
+    sign = '-' if total_seconds < 0 else ''
+    degrees, remainder = divmod(abs(total_seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{sign}{degrees}:{minutes}:{seconds}"
+
+def parse_date(date):
+    """Parse a YYYY-MM-DD or YYYY/MM/DD date string"""
+    match = DATE_PATTERN.match(date.replace('/', '-'))
+    if not match:
+        raise ValueError(f"Could not parse date format: {date}")
+    year, month, day = match.groups()
+    return datetime(int(year), int(month), int(day))
+
+def parse_birth_datetime(date, time):
+    """Parse birth date and 12-hour or 24-hour time without going through strptime"""
+    time_clean = time.strip()
+    match = TIME_PATTERN.match(time_clean)
+    if not match:
+        raise ValueError(f"Could not parse time format: {time_clean}")
+    hour, minute, second, meridiem = match.groups()
+    hour = int(hour)
+    
+    if meridiem:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Could not parse time format: {time_clean}")
+        hour = hour % 12 + (12 if meridiem[0] in 'Pp' else 0)
+        
+    return parse_date(date).replace(hour=hour, minute=int(minute), second=int(second or 0))
+
+def get_sign_index(longitude):
+    """Get zodiac sign ordinal (0 = Aries) from longitude"""
+    return int(longitude / 30) % 12
 
 def get_sign_from_longitude(longitude):
     """Get zodiac sign from longitude"""
     if longitude is None:
         return None
-    signs = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo', 
-             'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-    index = int(longitude / 30) % 12
-    return signs[index]
+    return SIGNS[get_sign_index(longitude)]
+
+def get_dominant(names, totals):
+    """Get the name with the highest total in one pass (first wins ties, 'Unknown' if all zero)"""
+    dominant, best = 'Unknown', 0
+    for name, total in zip(names, totals):
+        if total > best:
+            dominant, best = name, total
+    return dominant
 
 def get_hd_gate_and_line(longitude):
     """
     Convert longitude to Human Design gate and line.
-    ROOT CAUSE FIXED: Using the exact gate positions from official HD sources.
     
-    Based on verified positions from search results:
+    Every gate spans exactly 5°37'30" (5.625°) and every line 0°56'15" (0.9375°),
+    so both come straight from arithmetic on the offset into the gate wheel:
     - Gate 23 is at 18°52'30" - 24°30'00" Taurus (48.875° - 54.5° longitude)
     - Gate 8 is at 24°30'00" - 30°00'00" Taurus (54.5° - 60° longitude)
     
@@ -114,175 +258,35 @@ def get_hd_gate_and_line(longitude):
     if longitude is None:
         return None, None
     
-    # Normalize longitude to 0-360
-    longitude = longitude % 360.0
-    
-    # EXACT GATE POSITIONS based on verified Human Design sources
-    # Format: (start_longitude, end_longitude, gate_number)
-    gate_positions = [
-        # Aries (0° - 30°)
-        (0.000, 3.875, 25),      # 0°0'00" - 3°52'30" Aries
-        (3.875, 9.500, 17),      # 3°52'30" - 9°30'00" Aries
-        (9.500, 15.125, 21),     # 9°30'00" - 15°07'30" Aries
-        (15.125, 20.750, 51),    # 15°07'30" - 20°45'00" Aries
-        (20.750, 26.375, 42),    # 20°45'00" - 26°22'30" Aries
-        (26.375, 30.000, 3),     # 26°22'30" - 30°00'00" Aries
-        
-        # Taurus (30° - 60°)
-        (30.000, 32.000, 3),     # 0°00'00" - 2°00'00" Taurus (continuation)
-        (32.000, 37.625, 27),    # 2°00'00" - 7°37'30" Taurus
-        (37.625, 43.250, 24),    # 7°37'30" - 13°15'00" Taurus
-        (43.250, 48.875, 2),     # 13°15'00" - 18°52'30" Taurus
-        (48.875, 54.500, 23),    # 18°52'30" - 24°30'00" Taurus ← Karen's Sun here
-        (54.500, 60.000, 8),     # 24°30'00" - 30°00'00" Taurus
-        
-        # Gemini (60° - 90°)
-        (60.000, 60.125, 8),     # 0°00'00" - 0°07'30" Gemini (continuation)
-        (60.125, 65.750, 20),    # 0°07'30" - 5°45'00" Gemini
-        (65.750, 71.375, 16),    # 5°45'00" - 11°22'30" Gemini
-        (71.375, 77.000, 35),    # 11°22'30" - 17°00'00" Gemini
-        (77.000, 82.625, 45),    # 17°00'00" - 22°37'30" Gemini
-        (82.625, 88.250, 12),    # 22°37'30" - 28°15'00" Gemini
-        (88.250, 90.000, 15),    # 28°15'00" - 30°00'00" Gemini
-        
-        # Cancer (90° - 120°)
-        (90.000, 93.875, 15),    # 0°00'00" - 3°52'30" Cancer (continuation)
-        (93.875, 99.500, 52),    # 3°52'30" - 9°30'00" Cancer
-        (99.500, 105.125, 39),   # 9°30'00" - 15°07'30" Cancer
-        (105.125, 110.750, 53),  # 15°07'30" - 20°45'00" Cancer
-        (110.750, 116.375, 62),  # 20°45'00" - 26°22'30" Cancer
-        (116.375, 120.000, 56),  # 26°22'30" - 30°00'00" Cancer
-        
-        # Leo (120° - 150°)
-        (120.000, 122.000, 56),  # 0°00'00" - 2°00'00" Leo (continuation)
-        (122.000, 127.625, 31),  # 2°00'00" - 7°37'30" Leo
-        (127.625, 133.250, 33),  # 7°37'30" - 13°15'00" Leo
-        (133.250, 138.875, 7),   # 13°15'00" - 18°52'30" Leo
-        (138.875, 144.500, 4),   # 18°52'30" - 24°30'00" Leo
-        (144.500, 150.000, 29),  # 24°30'00" - 30°00'00" Leo
-        
-        # Virgo (150° - 180°)
-        (150.000, 150.125, 29),  # 0°00'00" - 0°07'30" Virgo (continuation)
-        (150.125, 155.750, 59),  # 0°07'30" - 5°45'00" Virgo
-        (155.750, 161.375, 40),  # 5°45'00" - 11°22'30" Virgo
-        (161.375, 167.000, 64),  # 11°22'30" - 17°00'00" Virgo
-        (167.000, 172.625, 47),  # 17°00'00" - 22°37'30" Virgo
-        (172.625, 178.250, 6),   # 22°37'30" - 28°15'00" Virgo
-        (178.250, 180.000, 46),  # 28°15'00" - 30°00'00" Virgo
-        
-        # Libra (180° - 210°)
-        (180.000, 183.875, 46),  # 0°00'00" - 3°52'30" Libra (continuation)
-        (183.875, 189.500, 18),  # 3°52'30" - 9°30'00" Libra
-        (189.500, 195.125, 48),  # 9°30'00" - 15°07'30" Libra
-        (195.125, 200.750, 57),  # 15°07'30" - 20°45'00" Libra
-        (200.750, 206.375, 32),  # 20°45'00" - 26°22'30" Libra
-        (206.375, 210.000, 50),  # 26°22'30" - 30°00'00" Libra
-        
-        # Scorpio (210° - 240°)
-        (210.000, 212.000, 50),  # 0°00'00" - 2°00'00" Scorpio (continuation)
-        (212.000, 217.625, 28),  # 2°00'00" - 7°37'30" Scorpio
-        (217.625, 223.250, 44),  # 7°37'30" - 13°15'00" Scorpio
-        (223.250, 228.875, 1),   # 13°15'00" - 18°52'30" Scorpio
-        (228.875, 234.500, 43),  # 18°52'30" - 24°30'00" Scorpio
-        (234.500, 240.000, 14),  # 24°30'00" - 30°00'00" Scorpio
-        
-        # Sagittarius (240° - 270°)
-        (240.000, 240.125, 14),  # 0°00'00" - 0°07'30" Sagittarius (continuation)
-        (240.125, 245.750, 34),  # 0°07'30" - 5°45'00" Sagittarius
-        (245.750, 251.375, 9),   # 5°45'00" - 11°22'30" Sagittarius
-        (251.375, 257.000, 5),   # 11°22'30" - 17°00'00" Sagittarius
-        (257.000, 262.625, 26),  # 17°00'00" - 22°37'30" Sagittarius
-        (262.625, 268.250, 11),  # 22°37'30" - 28°15'00" Sagittarius
-        (268.250, 270.000, 10),  # 28°15'00" - 30°00'00" Sagittarius
-        
-        # Capricorn (270° - 300°)
-        (270.000, 273.875, 10),  # 0°00'00" - 3°52'30" Capricorn (continuation)
-        (273.875, 279.500, 58),  # 3°52'30" - 9°30'00" Capricorn
-        (279.500, 285.125, 38),  # 9°30'00" - 15°07'30" Capricorn
-        (285.125, 290.750, 54),  # 15°07'30" - 20°45'00" Capricorn
-        (290.750, 296.375, 61),  # 20°45'00" - 26°22'30" Capricorn
-        (296.375, 300.000, 60),  # 26°22'30" - 30°00'00" Capricorn
-        
-        # Aquarius (300° - 330°)
-        (300.000, 302.000, 60),  # 0°00'00" - 2°00'00" Aquarius (continuation)
-        (302.000, 307.625, 41),  # 2°00'00" - 7°37'30" Aquarius
-        (307.625, 313.250, 19),  # 7°37'30" - 13°15'00" Aquarius
-        (313.250, 318.875, 13),  # 13°15'00" - 18°52'30" Aquarius
-        (318.875, 324.500, 49),  # 18°52'30" - 24°30'00" Aquarius
-        (324.500, 330.000, 30),  # 24°30'00" - 30°00'00" Aquarius
-        
-        # Pisces (330° - 360°)
-        (330.000, 330.125, 30),  # 0°00'00" - 0°07'30" Pisces (continuation)
-        (330.125, 335.750, 55),  # 0°07'30" - 5°45'00" Pisces
-        (335.750, 341.375, 37),  # 5°45'00" - 11°22'30" Pisces
-        (341.375, 347.000, 63),  # 11°22'30" - 17°00'00" Pisces
-        (347.000, 352.625, 22),  # 17°00'00" - 22°37'30" Pisces
-        (352.625, 358.250, 36),  # 22°37'30" - 28°15'00" Pisces
-        (358.250, 360.000, 25),  # 28°15'00" - 30°00'00" Pisces (wraps to Aries)
-    ]
-    
-    # Find which gate this longitude falls into
-    gate = None
-    gate_start = None
-    gate_end = None
-    
-    for start, end, gate_num in gate_positions:
-        if start <= longitude < end:
-            gate = gate_num
-            gate_start = start
-            gate_end = end
-            break
-    
-    # Handle edge case at exactly 360°
-    if gate is None and longitude >= 358.250:
-        gate = 25
-        gate_start = 358.250
-        gate_end = 360.000
-    
-    if gate is None:
-        logger.error(f"Could not find gate for longitude {longitude}")
-        return None, None
-    
-    # Calculate position within the gate
-    position_in_gate = longitude - gate_start
-    gate_span = gate_end - gate_start
+    # Offset into the gate wheel, which starts with Gate 17 at 3°52'30" Aries
+    offset = (longitude - GATE_WHEEL_START) % 360.0
     
-    # Calculate line (1-6)
-    # Each line spans 1/6 of the gate
-    line_span = gate_span / 6
-    line = int(position_in_gate / line_span) + 1
+    # The % 64 / min() guard float rounding right at 360° and the top of a gate
+    index = int(offset / GATE_WIDTH) % 64
+    gate = GATE_ORDER[index]
+    line = min(int((offset - index * GATE_WIDTH) / LINE_WIDTH) + 1, 6)
     
-    # Ensure line is in valid range
-    if line > 6:
-        line = 6
-    elif line < 1:
-        line = 1
-    
-    logger.debug(f"Longitude {longitude:.6f}° -> Gate {gate}, Line {line} (range: {gate_start}-{gate_end})")
+    # Called for every planet on every chart, so let logging defer the formatting
+    logger.debug("Longitude %.6f° -> Gate %s, Line %s", longitude, gate, line)
     
     return gate, line
 
-def calculate_house_position(planet_lon, house_cusps):
+def get_house_offsets(house_cusps):
+    """Get the first cusp and each of cusps 1-12 as its distance from it (ascending, for bisect)"""
+    if not house_cusps or len(house_cusps) < 12:
+        return None
+    first_cusp = house_cusps[0]
+    return first_cusp, [(cusp - first_cusp) % 360 for cusp in house_cusps[:12]]
+
+def calculate_house_position(planet_lon, house_offsets):
     """Determine which house a planet is in"""
-    if planet_lon is None or not house_cusps or len(house_cusps) < 12:
+    if planet_lon is None or not house_offsets:
         return None
         
-    # Use only the first 12 house cusps
-    cusps = house_cusps[:12]
-    
-    for i in range(12):
-        current_cusp = cusps[i]
-        next_cusp = cusps[(i + 1) % 12]
-        
-        # Handle houses that cross 0 degrees
-        if next_cusp < current_cusp:
-            if planet_lon >= current_cusp or planet_lon < next_cusp:
-                return i + 1
-        else:
-            if current_cusp <= planet_lon < next_cusp:
-                return i + 1
-                
-    return 1  # Fallback to first house
+    # Measuring from the first cusp removes the 0° wraparound, so a binary
+    # search over the ascending offsets finds the house directly
+    first_cusp, offsets = house_offsets
+    return bisect_right(offsets, (planet_lon - first_cusp) % 360)
 
 def calculate_house_cusps(julian_day, latitude, longitude):
     """Calculate house cusps using Placidus system"""
@@ -457,7 +461,9 @@ def get_planet_position(julian_day, planet_id, planet_name="Unknown"):
     try:
         # Try PySwissEph first
         result = swe.calc_ut(julian_day, planet_id)
-        if result[1] == 0:  # Success
+        if result[1] >= 0:  # Success: second item is the flags actually used, negative on error
+            if result[1] & swe.FLG_MOSEPH:
+                logger.warning(f"Ephemeris files not found for {planet_name}, using Moshier")
             return result[0][0]  # Longitude
         else:
             logger.warning(f"PySwissEph error {result[1]} for {planet_name}, using fallback")
@@ -467,59 +473,47 @@ def get_planet_position(julian_day, planet_id, planet_name="Unknown"):
         logger.warning(f"PySwissEph exception for {planet_name}: {e}, using fallback")
         return fallback_planet_calculation(julian_day, planet_name)
 
+@lru_cache(maxsize=4096)
+def _geocode(location):
+    """Look up coordinates for a normalized location string, caching successful results"""
+    response = SESSION.get(GEOCODE_URL, params={'address': location, 'key': GOOGLE_API_KEY},
+                           timeout=GEOCODE_TIMEOUT)
+    geo_data = response.json()
+    
+    if not geo_data.get('results'):
+        raise LookupError("Location not found. Please include city, state, country.")
+        
+    location_data = geo_data['results'][0]['geometry']['location']
+    return location_data['lat'], location_data['lng']
+
 def get_geocoding_data(location):
     """Get latitude and longitude from location string"""
     if not GOOGLE_API_KEY:
         return None, None, "Google API key not configured"
     
-    geo_url = f"https://maps.googleapis.com/maps/api/geocode/json?address={quote(location)}&key={GOOGLE_API_KEY}"
     try:
-        response = requests.get(geo_url, timeout=10)
-        geo_data = response.json()
-        
-        if not geo_data.get('results'):
-            return None, None, "Location not found. Please include city, state, country."
-            
-        location_data = geo_data['results'][0]['geometry']['location']
-        return location_data['lat'], location_data['lng'], None
+        # Birth cities repeat a lot, so normalize the key to maximize cache hits
+        lat, lon = _geocode(location.strip().lower())
+        return lat, lon, None
         
+    except LookupError as e:
+        return None, None, str(e)
     except requests.RequestException as e:
         return None, None, f"Geocoding request failed: {str(e)}"
     except Exception as e:
         return None, None, f"Geocoding failed: {str(e)}"
 
 def calculate_human_design(date, time, lat, lon):
+    """Calculate Human Design chart, reusing results for repeat birth data"""
+    # 0.01° is ~2.4 seconds of LMT correction, far below a gate line
+    return _calculate_human_design(date, time, round(lat, 2), round(lon, 2))
+
+@lru_cache(maxsize=8192)
+def _calculate_human_design(date, time, lat, lon):
     """Calculate Human Design chart with corrected gate sequence"""
     try:
         # Parse datetime - handle both 12-hour and 24-hour formats
-        time_clean = time.strip()
-        
-        # Try different time formats
-        dt = None
-        date_clean = date.replace('/', '-')
-        
-        # Try 12-hour format first (09:05 PM)
-        try:
-            dt = datetime.strptime(f"{date_clean} {time_clean}", "%Y-%m-%d %I:%M %p")
-        except ValueError:
-            pass
-            
-        # Try 24-hour format (21:05)
-        if dt is None:
-            try:
-                dt = datetime.strptime(f"{date_clean} {time_clean}", "%Y-%m-%d %H:%M")
-            except ValueError:
-                pass
-                
-        # Try without seconds
-        if dt is None:
-            try:
-                dt = datetime.strptime(f"{date_clean} {time_clean}", "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                pass
-                
-        if dt is None:
-            raise ValueError(f"Could not parse time format: {time_clean}")
+        dt = parse_birth_datetime(date, time)
         
         # Handle Australian timezone correctly for historical dates
         if lat and lon and lat < -10 and lon > 140:  # Rough Australian coordinates
@@ -532,7 +526,7 @@ def calculate_human_design(date, time, lat, lon):
             # Local Mean Time correction for precise astronomical calculations
             lmt_correction = (lon - 150.0) / 15.0  # 150°E is the standard meridian for UTC+10
             
-            logger.info(f"Location longitude: {lon}°, LMT correction: {lmt_correction:.3f} hours")
+            logger.debug("Location longitude: %s°, LMT correction: %.3f hours", lon, lmt_correction)
             
         else:
             timezone_offset = 0  # Default to UTC if not Australian
@@ -541,38 +535,23 @@ def calculate_human_design(date, time, lat, lon):
         # Convert local time to UTC with LMT correction
         dt_utc = dt - timedelta(hours=timezone_offset) - timedelta(hours=lmt_correction)
         
-        logger.info(f"Birth time: {dt} (local), UTC: {dt_utc}, Timezone offset: +{timezone_offset}, LMT correction: {lmt_correction:.3f}h")
+        logger.debug("Birth time: %s (local), UTC: %s, Timezone offset: +%s, LMT correction: %.3fh",
+                     dt, dt_utc, timezone_offset, lmt_correction)
         
         # Convert to Julian Day (UTC)
         jd_natal = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, dt_utc.hour + dt_utc.minute/60.0)
         
-        # Design date (88.25 days before birth - this is the exact HD calculation)
-        design_dt_utc = dt_utc - timedelta(days=88, hours=6)  # 88.25 days = 88 days 6 hours
-        jd_design = swe.julday(design_dt_utc.year, design_dt_utc.month, design_dt_utc.day, 
-                              design_dt_utc.hour + design_dt_utc.minute/60.0)
-                              
-        logger.info(f"Natal JD: {jd_natal}, Design JD: {jd_design}")
+        # Design date (88.25 days before birth - this is the exact HD calculation).
+        # Julian days are continuous, so this is a plain subtraction
+        jd_design = jd_natal - DESIGN_OFFSET_DAYS
         
-        # Planets to calculate
-        planets = {
-            'Sun': swe.SUN,
-            'Moon': swe.MOON,
-            'Mercury': swe.MERCURY,
-            'Venus': swe.VENUS,
-            'Mars': swe.MARS,
-            'Jupiter': swe.JUPITER,
-            'Saturn': swe.SATURN,
-            'Uranus': swe.URANUS,
-            'Neptune': swe.NEPTUNE,
-            'Pluto': swe.PLUTO,
-            'North Node': swe.MEAN_NODE
-        }
+        logger.debug("Natal JD: %s, Design JD: %s", jd_natal, jd_design)
         
         personality_gates = {}
         design_gates = {}
         
         # Calculate personality positions (natal)
-        for planet_name, planet_id in planets.items():
+        for planet_name, planet_id in HD_PLANETS:
             try:
                 longitude = get_planet_position(jd_natal, planet_id, planet_name)
                 if longitude is not None:
@@ -589,7 +568,7 @@ def calculate_human_design(date, time, lat, lon):
                 logger.error(f"Error calculating {planet_name}: {e}")
                 
         # Calculate design positions
-        for planet_name, planet_id in planets.items():
+        for planet_name, planet_id in HD_PLANETS:
             try:
                 longitude = get_planet_position(jd_design, planet_id, planet_name)
                 if longitude is not None:
@@ -606,30 +585,30 @@ def calculate_human_design(date, time, lat, lon):
                 logger.error(f"Error calculating Design {planet_name}: {e}")
         
         # Get all active gates
-        all_gates = set()
-        for planet_data in personality_gates.values():
-            if planet_data.get('gate'):
-                all_gates.add(planet_data['gate'])
-        for planet_data in design_gates.values():
-            if planet_data.get('gate'):
-                all_gates.add(planet_data['gate'])
+        all_gates = {planet_data['gate']
+                     for gates in (personality_gates, design_gates)
+                     for planet_data in gates.values() if planet_data.get('gate')}
+            
+        # Fold the active gates into one bitmask so each center/channel test is a single AND
+        gate_mask = 0
+        for gate in all_gates:
+            gate_mask |= 1 << gate
             
         # Determine defined centers
-        centers = {}
-        for center, gates in CENTER_GATES.items():
-            centers[center] = any(gate in all_gates for gate in gates)
+        centers = {center: bool(gate_mask & mask) for center, mask in CENTER_MASKS.items()}
             
         # Determine active channels
-        active_channels = []
-        for (gate1, gate2), channel_name in CHANNELS.items():
-            if gate1 in all_gates and gate2 in all_gates:
-                active_channels.append(f"{gate1}-{gate2} ({channel_name})")
+        active_channels = [label for mask, label in CHANNEL_MASKS if (gate_mask & mask) == mask]
                 
+        # Read the centers that drive type and authority once
+        sacral_defined = centers['Sacral']
+        throat_defined = centers['Throat']
+        heart_defined = centers['Heart']
+        g_defined = centers['G']
+        solar_plexus_defined = centers['SolarPlexus']
+        spleen_defined = centers['Spleen']
+        
         # Determine type based on defined centers
-        sacral_defined = centers.get('Sacral', False)
-        throat_defined = centers.get('Throat', False)
-        heart_defined = centers.get('Heart', False)
-        g_defined = centers.get('G', False)
         
         if sacral_defined and throat_defined:
             type_name = 'Manifesting Generator'
@@ -657,16 +636,16 @@ def calculate_human_design(date, time, lat, lon):
             signature = 'Success'
             not_self = 'Bitterness'
             
-        # Determine authority
-        if centers.get('SolarPlexus'):
+        # Determine authority (reaching a branch already means every earlier center is undefined)
+        if solar_plexus_defined:
             authority = 'Emotional - Solar Plexus'
-        elif centers.get('Sacral') and not centers.get('SolarPlexus'):
+        elif sacral_defined:
             authority = 'Sacral'
-        elif centers.get('Spleen') and not (centers.get('SolarPlexus') or centers.get('Sacral')):
+        elif spleen_defined:
             authority = 'Splenic'
-        elif centers.get('Heart') and not (centers.get('SolarPlexus') or centers.get('Sacral') or centers.get('Spleen')):
+        elif heart_defined:
             authority = 'Ego'
-        elif centers.get('G') and not (centers.get('SolarPlexus') or centers.get('Sacral') or centers.get('Spleen') or centers.get('Heart')):
+        elif g_defined:
             authority = 'Self-Projected'
         else:
             authority = 'Mental - Outer Authority'
@@ -681,8 +660,10 @@ def calculate_human_design(date, time, lat, lon):
         
         profile = f"{profile_line1}/{profile_line2}"
         
-        # Incarnation Cross calculation
+        # Incarnation Cross calculation (Design Earth sits opposite the Design Sun)
         sun_gate_personality = sun_personality.get('gate', 1)
+        sun_design_lon = sun_design.get('longitude')
+        earth_design_gate = get_hd_gate_and_line(sun_design_lon + 180)[0] if sun_design_lon is not None else None
         earth_gate_design = earth_design_gate if earth_design_gate else 2
         
         # For simplicity, using a basic cross name
@@ -706,12 +687,12 @@ def calculate_human_design(date, time, lat, lon):
             'signature': signature,
             'not_self_theme': not_self,
             'centers': centers,
-            'gates': sorted(list(all_gates)),
+            'gates': sorted(all_gates),
             'channels': active_channels,
             'personality_gates': personality_gates,
             'design_gates': design_gates,
-            'digestion': 'Calm' if 32 in all_gates else 'Nervous',
-            'environment': 'Mountains' if 15 in all_gates else 'Valleys',
+            'digestion': 'Calm' if gate_mask & (1 << 32) else 'Nervous',
+            'environment': 'Mountains' if gate_mask & (1 << 15) else 'Valleys',
             'timezone_used': f"UTC+{timezone_offset}",
             'utc_birth_time': dt_utc.isoformat()
         }
@@ -721,30 +702,17 @@ def calculate_human_design(date, time, lat, lon):
         return None
 
 def calculate_astrology_chart(date, time, lat, lon, timezone_offset=0):
+    """Calculate tropical astrology chart, reusing results for repeat birth data"""
+    # Rounding to 0.01° (~1 km) keeps the chart intact and lets nearby
+    # geocodes of the same city share a cache entry
+    return _calculate_astrology_chart(date, time, round(lat, 2), round(lon, 2), timezone_offset)
+
+@lru_cache(maxsize=2048)
+def _calculate_astrology_chart(date, time, lat, lon, timezone_offset):
     """Calculate tropical astrology chart using PySwissEph"""
     try:
         # Parse datetime - handle both 12-hour and 24-hour formats
-        time_clean = time.strip()
-        date_clean = date.replace('/', '-')
-        
-        # Try different time formats
-        dt = None
-        
-        # Try 12-hour format first (09:05 PM)
-        try:
-            dt = datetime.strptime(f"{date_clean} {time_clean}", "%Y-%m-%d %I:%M %p")
-        except ValueError:
-            pass
-            
-        # Try 24-hour format (21:05)
-        if dt is None:
-            try:
-                dt = datetime.strptime(f"{date_clean} {time_clean}", "%Y-%m-%d %H:%M")
-            except ValueError:
-                pass
-                
-        if dt is None:
-            raise ValueError(f"Could not parse time format: {time_clean}")
+        dt = parse_birth_datetime(date, time)
         
         # Adjust for timezone (convert to UTC)
         dt_utc = dt - timedelta(hours=timezone_offset)
@@ -754,6 +722,7 @@ def calculate_astrology_chart(date, time, lat, lon, timezone_offset=0):
         house_cusps, ascmc = calculate_house_cusps(jd, lat, lon)
         if house_cusps is None:
             return None
+        house_offsets = get_house_offsets(house_cusps)
             
         # Extract angles
         ascendant = ascmc[0]
@@ -761,75 +730,40 @@ def calculate_astrology_chart(date, time, lat, lon, timezone_offset=0):
         descendant = (ascendant + 180) % 360
         ic = (midheaven + 180) % 360
         
-        # Standard planets
-        planets = {
-            'Sun': swe.SUN,
-            'Moon': swe.MOON,
-            'Mercury': swe.MERCURY,
-            'Venus': swe.VENUS,
-            'Mars': swe.MARS,
-            'Jupiter': swe.JUPITER,
-            'Saturn': swe.SATURN,
-            'Uranus': swe.URANUS,
-            'Neptune': swe.NEPTUNE,
-            'Pluto': swe.PLUTO
-        }
-        
         planet_data = {}
+        placement_lons = []
         
         # Calculate planet positions
-        for planet_name, planet_id in planets.items():
+        for planet_name, planet_id in CHART_PLANETS:
             longitude = get_planet_position(jd, planet_id, planet_name)
             if longitude is not None:
+                placement_lons.append(longitude)
                 planet_data[planet_name] = {
                     'sign': get_sign_from_longitude(longitude),
                     'degree': round(longitude, 2),
-                    'house': calculate_house_position(longitude, house_cusps)
+                    'house': calculate_house_position(longitude, house_offsets)
                 }
         
-        # Calculate Chiron
-        chiron_lon = get_planet_position(jd, swe.CHIRON, 'Chiron')
-        if chiron_lon is not None:
-            planet_data['Chiron'] = {
-                'sign': get_sign_from_longitude(chiron_lon),
-                'degree': round(chiron_lon, 2),
-                'house': calculate_house_position(chiron_lon, house_cusps)
-            }
+        asc_sign = get_sign_from_longitude(ascendant)
+        mc_sign = get_sign_from_longitude(midheaven)
         
-        # Calculate Lilith (Mean Black Moon)
-        lilith_lon = get_planet_position(jd, swe.MEAN_APOG, 'Lilith')
-        if lilith_lon is not None:
-            planet_data['Lilith'] = {
-                'sign': get_sign_from_longitude(lilith_lon),
-                'degree': round(lilith_lon, 2),
-                'house': calculate_house_position(lilith_lon, house_cusps)
-            }
+        # Calculate dominant element and mode over all placements plus angles
+        placement_lons.append(ascendant)
+        placement_lons.append(midheaven)
         
-        # Calculate dominant element and mode
-        all_signs = []
-        for planet in planet_data.values():
-            if planet.get('sign'):
-                all_signs.append(planet['sign'])
+        element_totals = [0] * len(ELEMENT_NAMES)
+        mode_totals = [0] * len(MODE_NAMES)
         
-        # Add angles
-        asc_sign = get_sign_from_longitude(ascendant)
-        mc_sign = get_sign_from_longitude(midheaven)
-        if asc_sign:
-            all_signs.append(asc_sign)
-        if mc_sign:
-            all_signs.append(mc_sign)
+        for lon in placement_lons:
+            element_index, mode_index = SIGN_INFO[get_sign_index(lon)]
+            element_totals[element_index] += 1
+            mode_totals[mode_index] += 1
             
-        element_counts = {'Fire': 0, 'Earth': 0, 'Air': 0, 'Water': 0}
-        mode_counts = {'Cardinal': 0, 'Fixed': 0, 'Mutable': 0}
-        
-        for sign in all_signs:
-            if sign and sign.upper() in ELEMENTS:
-                element_counts[ELEMENTS[sign.upper()]] += 1
-            if sign and sign.upper() in MODES:
-                mode_counts[MODES[sign.upper()]] += 1
+        element_counts = dict(zip(ELEMENT_NAMES, element_totals))
+        mode_counts = dict(zip(MODE_NAMES, mode_totals))
                 
-        dominant_element = max(element_counts, key=element_counts.get) if any(element_counts.values()) else 'Unknown'
-        dominant_mode = max(mode_counts, key=mode_counts.get) if any(mode_counts.values()) else 'Unknown'
+        dominant_element = get_dominant(ELEMENT_NAMES, element_totals)
+        dominant_mode = get_dominant(MODE_NAMES, mode_totals)
         
         # House information
         house_info = []
@@ -860,10 +794,11 @@ def calculate_astrology_chart(date, time, lat, lon, timezone_offset=0):
         logger.error(f"Astrology calculation failed: {str(e)}")
         return None
 
+@lru_cache(maxsize=4096)
 def calculate_moon_phase(date):
-    """Calculate moon phase for a given date"""
+    """Calculate moon phase for a given date (cached, the answer never changes)"""
     try:
-        dt = datetime.strptime(date.replace('/', '-'), "%Y-%m-%d")
+        dt = parse_date(date)
         jd = swe.julday(dt.year, dt.month, dt.day, 12.0)  # Noon
         
         # Get Sun and Moon positions
@@ -877,31 +812,8 @@ def calculate_moon_phase(date):
         # Calculate angular distance
         distance = (moon_lon - sun_lon) % 360
         
-        # Determine phase
-        if 0 <= distance < 45:
-            phase = "New Moon"
-            tcm_energy = "Rest & Renewal"
-        elif 45 <= distance < 90:
-            phase = "Waxing Crescent"
-            tcm_energy = "Growth & Building"
-        elif 90 <= distance < 135:
-            phase = "First Quarter"
-            tcm_energy = "Growth & Building"
-        elif 135 <= distance < 180:
-            phase = "Waxing Gibbous"
-            tcm_energy = "Expansion & Harvest"
-        elif 180 <= distance < 225:
-            phase = "Full Moon"
-            tcm_energy = "Expansion & Harvest"
-        elif 225 <= distance < 270:
-            phase = "Waning Gibbous"
-            tcm_energy = "Release & Cleansing"
-        elif 270 <= distance < 315:
-            phase = "Last Quarter"
-            tcm_energy = "Release & Cleansing"
-        else:
-            phase = "Waning Crescent"
-            tcm_energy = "Deep Rest"
+        # Determine phase from its 45° bucket
+        phase, tcm_energy = MOON_PHASES[int(distance // 45) % 8]
             
         return {
             'date': date,
@@ -918,6 +830,17 @@ def calculate_moon_phase(date):
 
 # API ENDPOINTS
 
+def validate_birth_params():
+    """Check required birth query parameters up front, before any geocoding or ephemeris work"""
+    missing = [name for name in ('date', 'time', 'location') if not request.args.get(name)]
+    if missing:
+        return f"Missing required parameters: {', '.join(missing)}"
+    try:
+        parse_birth_datetime(request.args['date'], request.args['time'])
+    except ValueError as e:
+        return f"Invalid date or time: {str(e)}"
+    return None
+
 @app.route('/debug/ephe', methods=['GET'])
 def debug_ephemeris():
     """Debug endpoint to check ephemeris files"""
@@ -939,10 +862,12 @@ def debug_ephemeris():
     # Test calculation
     try:
         test_jd = swe.julday(2023, 6, 1, 12.0)
-        sun_lon = get_planet_position(test_jd, swe.SUN, "Sun")
+        result = swe.calc_ut(test_jd, swe.SUN)
+        moshier = bool(result[1] & swe.FLG_MOSEPH)
         ephe_status['test_calculation'] = {
-            'success': sun_lon is not None,
-            'sun_longitude': sun_lon
+            'success': result[1] >= 0 and not moshier,
+            'moshier_fallback': moshier,
+            'sun_longitude': result[0][0]
         }
     except Exception as e:
         ephe_status['test_calculation'] = {
@@ -1005,9 +930,10 @@ def test_karen_chart():
             return jsonify({'error': 'Human Design calculation failed'}), 500
         
         # Extract key values for verification
-        sun_gate = hd_data['personality_gates'].get('Sun', {}).get('gate')
-        sun_line = hd_data['personality_gates'].get('Sun', {}).get('line')
-        sun_longitude = hd_data['personality_gates'].get('Sun', {}).get('longitude')
+        sun = hd_data['personality_gates'].get('Sun', {})
+        sun_gate = sun.get('gate')
+        sun_line = sun.get('line')
+        sun_longitude = sun.get('longitude')
         profile = hd_data.get('profile')
         
         # Calculate what gate/line we expect based on longitude
@@ -1063,8 +989,9 @@ def get_human_design_profile():
         time = request.args.get('time')
         location = request.args.get('location')
         
-        if not all([date, time, location]):
-            return jsonify({"error": "Missing required parameters: date, time, location"}), 400
+        error = validate_birth_params()
+        if error:
+            return jsonify({"error": error}), 400
         
         # Get coordinates
         lat, lon, error = get_geocoding_data(location)
@@ -1076,16 +1003,17 @@ def get_human_design_profile():
         if not hd_data:
             return jsonify({"error": "Human Design calculation failed"}), 500
             
-        # Add request info
-        hd_data.update({
+        # Add request info (on a copy, the calculated chart is cached and shared)
+        result = {
+            **hd_data,
             'name': name,
             'date': date,
             'time': time,
             'location': location,
             'coordinates': {'latitude': lat, 'longitude': lon}
-        })
+        }
         
-        return jsonify(hd_data)
+        return jsonify(result)
         
     except Exception as e:
         logger.error(f"Human Design endpoint error: {str(e)}")
@@ -1100,10 +1028,15 @@ def get_astrology_chart():
         date = request.args.get('date')
         time = request.args.get('time')
         location = request.args.get('location')
-        timezone_offset = float(request.args.get('timezone_offset', 0))  # Hours from UTC
         
-        if not all([date, time, location]):
-            return jsonify({"error": "Missing required parameters: date, time, location"}), 400
+        error = validate_birth_params()
+        if error:
+            return jsonify({"error": error}), 400
+            
+        try:
+            timezone_offset = float(request.args.get('timezone_offset', 0))  # Hours from UTC
+        except ValueError:
+            return jsonify({"error": "Invalid timezone_offset: expected hours from UTC"}), 400
         
         # Get coordinates
         lat, lon, error = get_geocoding_data(location)
@@ -1141,6 +1074,11 @@ def get_moon_phase():
         
         if not date:
             return jsonify({"error": "Missing required parameter: date"}), 400
+            
+        try:
+            start_date = parse_date(date)
+        except ValueError as e:
+            return jsonify({"error": f"Invalid date: {str(e)}"}), 400
         
         if range_query == 'single':
             phase_data = calculate_moon_phase(date)
@@ -1150,7 +1088,6 @@ def get_moon_phase():
             
         elif range_query == '6week':
             # Calculate for 6 weeks (42 days)
-            start_date = datetime.strptime(date.replace('/', '-'), "%Y-%m-%d")
             moon_phases = []
             
             for i in range(0, 42, 7):  # Weekly intervals
@@ -1187,4 +1124,6 @@ def health_check():
     })
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=10000)
+    # Local development only; production runs under gunicorn (see gunicorn.conf.py).
+    # The debugger and reloader are opt-in via FLASK_DEBUG=1.
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', host='0.0.0.0', port=10000)
@@ -0,0 +1,13 @@
+import os
+
+# Gunicorn settings for production (the Flask dev server in app.py is for local use only)
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+
+# Threaded workers let one request's blocking geocode call overlap another's
+# ephemeris work. Each worker holds its own chart caches, so the default stays
+# small (cpu_count() sees the host's cores, not the container's quota);
+# raise WEB_CONCURRENCY on larger instances
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+keepalive = 30